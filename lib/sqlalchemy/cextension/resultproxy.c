@@ -64,7 +64,7 @@ safe_rowproxy_reconstructor(PyObject *self, PyObject *args)
     if (obj == NULL)
         return NULL;
 
-    tmp = PyObject_CallMethod((PyObject *)obj, "__setstate__", "O", state);
+    tmp = PyObject_CallMethod((PyObject *)obj, "__setstate__", "(O)", state);
     if (tmp == NULL) {
         Py_DECREF(obj);
         return NULL;
@@ -98,48 +98,55 @@ BaseRow_init(BaseRow *self, PyObject *args, PyObject *kwds)
     Py_INCREF(parent);
     self->parent = parent;
 
-    values_fastseq = PySequence_Fast(row, "row must be a sequence");
-    if (values_fastseq == NULL)
-        return -1;
-
-    num_values = PySequence_Length(values_fastseq);
-    num_processors = PyList_Size(processors);
-    if (num_values != num_processors) {
-        PyErr_Format(PyExc_RuntimeError,
-            "number of values in row (%d) differ from number of column "
-            "processors (%d)",
-            (int)num_values, (int)num_processors);
-        return -1;
-    }
-
-    result = PyTuple_New(num_values);
-    if (result == NULL)
-        return -1;
+    if (processors == Py_None) {
+        /* no column has a processor; the row values are used as is */
+        result = PySequence_Tuple(row);
+        if (result == NULL)
+            return -1;
+    } else {
+        values_fastseq = PySequence_Fast(row, "row must be a sequence");
+        if (values_fastseq == NULL)
+            return -1;
+
+        num_values = PySequence_Length(values_fastseq);
+        num_processors = PyList_Size(processors);
+        if (num_values != num_processors) {
+            PyErr_Format(PyExc_RuntimeError,
+                "number of values in row (%d) differ from number of column "
+                "processors (%d)",
+                (int)num_values, (int)num_processors);
+            return -1;
+        }
 
-    valueptr = PySequence_Fast_ITEMS(values_fastseq);
-    funcptr = PySequence_Fast_ITEMS(processors);
-    resultptr = PySequence_Fast_ITEMS(result);
-    while (--num_values >= 0) {
-        func = *funcptr;
-        if (func != Py_None) {
-            processed_value = PyObject_CallFunctionObjArgs(
-                func, *valueptr, NULL);
-            if (processed_value == NULL) {
-                Py_DECREF(values_fastseq);
-                Py_DECREF(result);
-                return -1;
+        result = PyTuple_New(num_values);
+        if (result == NULL)
+            return -1;
+
+        valueptr = PySequence_Fast_ITEMS(values_fastseq);
+        funcptr = PySequence_Fast_ITEMS(processors);
+        resultptr = PySequence_Fast_ITEMS(result);
+        while (--num_values >= 0) {
+            func = *funcptr;
+            if (func != Py_None) {
+                processed_value = PyObject_CallFunctionObjArgs(
+                    func, *valueptr, NULL);
+                if (processed_value == NULL) {
+                    Py_DECREF(values_fastseq);
+                    Py_DECREF(result);
+                    return -1;
+                }
+                *resultptr = processed_value;
+            } else {
+                Py_INCREF(*valueptr);
+                *resultptr = *valueptr;
             }
-            *resultptr = processed_value;
-        } else {
-            Py_INCREF(*valueptr);
-            *resultptr = *valueptr;
+            valueptr++;
+            funcptr++;
+            resultptr++;
         }
-        valueptr++;
-        funcptr++;
-        resultptr++;
-    }
 
-    Py_DECREF(values_fastseq);
+        Py_DECREF(values_fastseq);
+    }
 
     self->row = result;
 
@@ -395,13 +402,20 @@ BaseRow_getattro(BaseRow *self, PyObject *name)
     PyObject *err_bytes;
 #endif
 
-    if (!(tmp = PyObject_GenericGetAttr((PyObject *)self, name))) {
-        if (!PyErr_ExceptionMatches(PyExc_AttributeError))
-            return NULL;
-        PyErr_Clear();
+    /* a name that is neither present on the class nor able to be in an
+     * instance __dict__ can only be a column name; skip the generic lookup
+     * for it, which would otherwise raise an AttributeError that is then
+     * discarded */
+    if (Py_TYPE(self)->tp_dictoffset != 0 ||
+            _PyType_Lookup(Py_TYPE(self), name) != NULL) {
+        if (!(tmp = PyObject_GenericGetAttr((PyObject *)self, name))) {
+            if (!PyErr_ExceptionMatches(PyExc_AttributeError))
+                return NULL;
+            PyErr_Clear();
+        }
+        else
+            return tmp;
     }
-    else
-        return tmp;
 
     tmp = BaseRow_subscript_mapping(self, name);
     if (tmp == NULL && PyErr_ExceptionMatches(PyExc_KeyError)) {
@@ -11,8 +11,10 @@
 import collections
 import functools
 import operator
+import re
 
 from .row import _baserow_usecext
+from .row import _row_class_for_columns
 from .row import BaseRow  # noqa
 from .row import LegacyRow  # noqa
 from .row import Row  # noqa
@@ -37,6 +39,16 @@ _UNPICKLED = util.symbol("unpickled")
 # cyclical import for sqlalchemy.future
 _future_Result = None
 
+# Row subclasses generated by CursorResultMetaData._row_class(), shared
+# among result metadata objects that have the same column names
+_row_classes = util.LRUCache(500)
+
+# column names that CursorResultMetaData._row_class() turns into
+# properties; names starting with an underscore are left to __getattr__
+# so that labels such as "__bool__" or "__classcell__" can't take on a
+# special meaning for the class
+_row_attribute_name = re.compile(r"[A-Za-z][A-Za-z0-9_]*\Z")
+
 # metadata entry tuple indexes.
 # using raw tuple is faster than namedtuple.
 MD_INDEX = 0  # integer index in cursor.description
@@ -53,6 +65,77 @@ class ResultMetaData(object):
     def _has_key(self, key):
         return key in self._keymap
 
+    def _index_for_key(self, key):
+        """Return the index of ``key`` for the pure Python BaseRow, adding
+        it to the index map.
+
+        The pure Python BaseRow looks up keys in a dictionary of plain
+        integer indexes rather than in the keymap itself, which stores a
+        record tuple per key.  The dictionary is filled from the keymap
+        by the first lookup that misses it, so that results whose rows
+        are never accessed by key don't pay for it, and keys located by
+        _key_fallback() are added to it so that they're only resolved
+        once.
+
+        """
+        index_map = self._index_map
+        if not index_map:
+            index_map.update(
+                [(k, rec[MD_INDEX]) for k, rec in self._keymap.items()]
+            )
+            if key in index_map:
+                return index_map[key]
+
+        rec = self._keymap.get(key) or self._key_fallback(key)
+        index_map[key] = rec[MD_INDEX]
+        return rec[MD_INDEX]
+
+    def _key_to_mdindex_pairs(self):
+        """Return a tuple of ``(key, index)`` pairs for :attr:`.keys`.
+
+        Keys are resolved as ``row._mapping[key]`` would resolve them and
+        the pairs are computed once per result; an ambiguous key raises
+        each time the pairs are requested.
+
+        """
+        pairs = self._mdindex_pairs
+        if pairs is None:
+            keymap = self._keymap
+            pairs = []
+            for key in self._non_none_keys:
+                try:
+                    rec = keymap[key]
+                except KeyError:
+                    rec = self._key_fallback(key)
+                if rec[MD_INDEX] is None:
+                    self._raise_for_ambiguous_column_name(rec)
+                pairs.append((key, rec[MD_INDEX]))
+            pairs = self._mdindex_pairs = tuple(pairs)
+        return pairs
+
+    def _keys_values_getter(self):
+        """Return a tuple of :attr:`.keys` and a callable that given a
+        row's data tuple returns the values for those keys.
+
+        The callable is None when the keys name the leading columns of the
+        row in order, in which case the data tuple can be used as is.
+
+        """
+        getter = self._values_getter
+        if getter is None:
+            pairs = self._key_to_mdindex_pairs()
+            keys = tuple([key for key, index in pairs])
+            indexes = [index for key, index in pairs]
+            if indexes == list(range(len(indexes))):
+                getter = (keys, None)
+            elif len(indexes) == 1:
+                index = indexes[0]
+                getter = (keys, lambda data: (data[index],))
+            else:
+                getter = (keys, operator.itemgetter(*indexes))
+            self._values_getter = getter
+        return getter
+
     def _key_fallback(self, key):
         if isinstance(key, int):
             raise IndexError(key)
@@ -61,10 +144,20 @@ class ResultMetaData(object):
 
 
 class SimpleResultMetaData(ResultMetaData):
-    __slots__ = "keys", "_keymap", "_processors"
+    __slots__ = (
+        "keys",
+        "_keymap",
+        "_index_map",
+        "_processors",
+        "_non_none_keys",
+        "_mdindex_pairs",
+        "_values_getter",
+    )
 
     def __init__(self, keys, extra=None):
         self.keys = list(keys)
+        self._mdindex_pairs = self._values_getter = None
+        self._non_none_keys = tuple([k for k in self.keys if k is not None])
 
         len_keys = len(keys)
 
@@ -82,7 +175,8 @@ class SimpleResultMetaData(ResultMetaData):
             for key, ex in zip(keys, extra):
                 rec = self._keymap[key]
                 self._keymap.update({e: rec for e in ex})
-        self._processors = [None] * len(keys)
+        self._index_map = {}
+        self._processors = None
 
     def __getstate__(self):
         return {"keys": self.keys}
@@ -97,6 +191,22 @@ class SimpleResultMetaData(ResultMetaData):
         return value in row._data
 
 
+def _process_columns(processors, rows):
+    """Apply result processors to a batch of raw rows column by column.
+
+    The batch is split into one list per column, each column that has a
+    processor is processed in a single pass, and the processed columns
+    are then zipped back into per-row tuples that need no further
+    processing.
+
+    """
+    columns = list(zip(*rows))
+    for idx, proc in enumerate(processors):
+        if proc:
+            columns[idx] = [proc(value) for value in columns[idx]]
+    return list(zip(*columns))
+
+
 def result_tuple(fields, extra=None):
     parent = SimpleResultMetaData(fields, extra)
     return functools.partial(Row, parent, parent._processors, parent._keymap)
@@ -108,10 +218,15 @@ class CursorResultMetaData(ResultMetaData):
 
     __slots__ = (
         "_keymap",
+        "_index_map",
         "case_sensitive",
         "matched_on_name",
         "_processors",
         "keys",
+        "_non_none_keys",
+        "_mdindex_pairs",
+        "_values_getter",
+        "_specialized_row_cls",
     )
 
     def __init__(self, parent, cursor_description):
@@ -119,6 +234,8 @@ class CursorResultMetaData(ResultMetaData):
         dialect = context.dialect
         self.case_sensitive = dialect.case_sensitive
         self.matched_on_name = False
+        self._mdindex_pairs = self._values_getter = None
+        self._specialized_row_cls = {}
 
         if context.result_column_struct:
             (
@@ -147,13 +264,18 @@ class CursorResultMetaData(ResultMetaData):
             loose_column_name_matching,
         )
 
+        # string keys for the Row._fields / RowMapping.keys() views,
+        # computed once per result rather than once per row
+        self._non_none_keys = tuple([k for k in self.keys if k is not None])
+
         self._keymap = {}
+        self._index_map = {}
         if not _baserow_usecext:
             # keymap indexes by integer index: this is only used
-            # in the pure Python BaseRow.__getitem__
-            # implementation to avoid an expensive
-            # isinstance(key, util.int_types) in the most common
-            # case path
+            # in the pure Python BaseRow, for the integer indexes
+            # that the getters from _getter() and _tuple_getter()
+            # pass to _get_by_key_impl_mapping(); LegacyRow.__getitem__
+            # indexes the row data directly for integer keys
 
             len_raw = len(raw)
 
@@ -169,10 +291,13 @@ class CursorResultMetaData(ResultMetaData):
             )
 
         # processors in key order for certain per-row
-        # views like __iter__ and slices
+        # views like __iter__ and slices.  if no column has a processor,
+        # this is None so that rows can skip the per-value processing step
         self._processors = [
             metadata_entry[MD_PROCESSOR] for metadata_entry in raw
         ]
+        if not any(self._processors):
+            self._processors = None
 
         # keymap by primary string...
         by_key = dict(
@@ -621,6 +746,51 @@ class CursorResultMetaData(ResultMetaData):
         ]
         return lambda rec: tuple(getter(rec) for getter in getters)
 
+    def _row_class(self, row_cls):
+        """Return the class used to create rows of type ``row_cls`` for
+        this result.
+
+        This is a subclass of ``row_cls`` that provides a property for
+        each unambiguous column name in :attr:`.keys` which is a plain
+        identifier not starting with an underscore and doesn't conflict
+        with an existing attribute of the class, so that ``row.colname``
+        attribute access doesn't need to go through ``__getattr__``.
+        Other string keys, such as labels or column keys that differ from
+        the name, continue to be resolved by ``__getattr__``.
+
+        This is only used for metadata that's cached on a compiled
+        statement, so that the class is generated once and then shared
+        by each execution of that statement.
+
+        """
+        try:
+            return self._specialized_row_cls[row_cls]
+        except KeyError:
+            pass
+
+        keymap = self._keymap
+        columns = tuple(
+            (key, keymap[key][MD_INDEX])
+            for key in self._non_none_keys
+            if isinstance(key, util.string_types)
+            and _row_attribute_name.match(key)
+            and key in keymap
+            and keymap[key][MD_INDEX] is not None
+            and not hasattr(row_cls, key)
+        )
+        if columns:
+            cache_key = (row_cls, columns)
+            cls = _row_classes.get(cache_key)
+            if cls is None:
+                cls = _row_classes[cache_key] = _row_class_for_columns(
+                    row_cls, columns
+                )
+        else:
+            cls = row_cls
+
+        self._specialized_row_cls[row_cls] = cls
+        return cls
+
     def __getstate__(self):
         return {
             "_keymap": {
@@ -634,10 +804,14 @@ class CursorResultMetaData(ResultMetaData):
         }
 
     def __setstate__(self, state):
-        self._processors = [None for _ in range(len(state["keys"]))]
+        self._processors = None
         self._keymap = state["_keymap"]
+        self._index_map = {}
+        self._mdindex_pairs = self._values_getter = None
+        self._specialized_row_cls = {}
 
         self.keys = state["keys"]
+        self._non_none_keys = tuple([k for k in self.keys if k is not None])
         self.case_sensitive = state["case_sensitive"]
         self.matched_on_name = state["matched_on_name"]
 
@@ -1085,6 +1259,13 @@ class BaseResult(object):
         self._echo = (
             self.connection._echo and context.engine._should_log_debug()
         )
+        # columnar processing is used by default with the pure Python
+        # BaseRow, whose per-row processing loop runs in Python; the
+        # C extension's loop is faster than splitting batches into
+        # columns and back
+        self._columnar = context.execution_options.get(
+            "_columnar_results", not _baserow_usecext
+        )
         self._init_metadata()
 
     def _init_metadata(self):
@@ -1096,6 +1277,13 @@ class BaseResult(object):
             if self.context.compiled:
                 if self.context.compiled._cached_metadata:
                     self._metadata = self.context.compiled._cached_metadata
+                    # metadata that's reused across executions has a row
+                    # class with a property per column name; it's only
+                    # generated for cached metadata, so that statements
+                    # compiled for a single execution don't pay for it
+                    self._process_row = self._metadata._row_class(
+                        self._process_row
+                    )
                 else:
                     self._metadata = (
                         self.context.compiled._cached_metadata
@@ -1561,16 +1749,19 @@ class ResultProxy(BaseResult):
         processors = metadata._processors
 
         if self._echo:
+            # rows are logged as received from the cursor, before
+            # any processing
             log = self.context.engine.logger.debug
-            l = []
             for row in rows:
                 log("Row %r", sql_util._repr_row(row))
-                l.append(process_row(metadata, processors, keymap, row))
-            return l
-        else:
-            return [
-                process_row(metadata, processors, keymap, row) for row in rows
-            ]
+
+        if self._columnar and processors and len(rows) > 1:
+            # columnar mode; run each column's processor over the
+            # whole batch, rows are then built from the processed values
+            rows = _process_columns(processors, rows)
+            processors = None
+
+        return [process_row(metadata, processors, keymap, row) for row in rows]
 
     def fetchall(self):
         """Fetch all rows, just like DB-API ``cursor.fetchall()``.
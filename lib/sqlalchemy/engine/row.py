@@ -48,20 +48,31 @@ except ImportError:
     _baserow_usecext = False
 
     class BaseRow(object):
-        __slots__ = ("_parent", "_data", "_keymap")
+        __slots__ = ("_parent", "_data")
 
         def __init__(self, parent, processors, keymap, data):
-            """Row objects are constructed by ResultProxy objects."""
+            """Row objects are constructed by ResultProxy objects.
+
+            The keymap is the same for every row of a result, so it isn't
+            stored on the row; it's available from the parent.
+
+            """
 
             self._parent = parent
 
-            self._data = tuple(
-                [
-                    proc(value) if proc else value
-                    for proc, value in zip(processors, data)
-                ]
-            )
-            self._keymap = keymap
+            if processors:
+                self._data = tuple(
+                    [
+                        proc(value) if proc else value
+                        for proc, value in zip(processors, data)
+                    ]
+                )
+            else:
+                self._data = tuple(data)
+
+        @property
+        def _keymap(self):
+            return self._parent._keymap
 
         def __reduce__(self):
             return (
@@ -70,7 +81,7 @@ except ImportError:
             )
 
         def _values_impl(self):
-            return list(self)
+            return list(self._data)
 
         def __iter__(self):
             return iter(self._data)
@@ -81,39 +92,44 @@ except ImportError:
         def __hash__(self):
             return hash(self._data)
 
-        def _subscript_impl(self, key, ismapping):
+        def _mdindex_for_key(self, key):
+            # the parent's index map stores just the MD_INDEX of each
+            # keymap record, and is filled in by _index_for_key(); the
+            # full record is only needed to report an ambiguous column.
+            # Integer keys are located via the integer entries in the
+            # index map.
             try:
-                rec = self._keymap[key]
+                mdindex = self._parent._index_map[key]
             except KeyError:
-                rec = self._parent._key_fallback(key)
-            except TypeError:
-                # the non-C version detects a slice using TypeError.
-                # this is pretty inefficient for the slice use case
-                # but is more efficient for the integer use case since we
-                # don't have to check it up front.
-                if isinstance(key, slice):
-                    return tuple(self._data[key])
-                else:
-                    raise
-
-            mdindex = rec[MD_INDEX]
+                mdindex = self._parent._index_for_key(key)
+
             if mdindex is None:
-                self._parent._raise_for_ambiguous_column_name(rec)
-            elif not ismapping and mdindex != key and not isinstance(key, int):
+                self._parent._raise_for_ambiguous_column_name(
+                    self._parent._keymap[key]
+                )
+            return mdindex
+
+        def _get_by_key_impl(self, key):
+            # slices are checked up front so that the index map lookup
+            # doesn't need a TypeError handler.  Only tuple-like access
+            # takes slices; mapping access, which the ORM's getters use
+            # with an integer index per value, skips the check.
+            if isinstance(key, slice):
+                return tuple(self._data[key])
+
+            mdindex = self._mdindex_for_key(key)
+            if mdindex != key and not isinstance(key, int):
                 self._parent._warn_for_nonint(key)
 
             # TODO: warn for non-int here, RemovedIn20Warning when available
 
             return self._data[mdindex]
 
-        def _get_by_key_impl(self, key):
-            return self._subscript_impl(key, False)
-
         def _get_by_key_impl_mapping(self, key):
             # the C code has two different methods so that we can distinguish
             # between tuple-like keys (integers, slices) and mapping-like keys
             # (strings, objects)
-            return self._subscript_impl(key, True)
+            return self._data[self._mdindex_for_key(key)]
 
         def __getattr__(self, name):
             try:
@@ -122,7 +138,7 @@ except ImportError:
                 raise AttributeError(e.args[0])
 
 
-class Row(BaseRow, collections_abc.Sequence):
+class Row(BaseRow):
     """Represent a single result row.
 
     The :class:`.Row` object represents a row of a database result.  It is
@@ -184,19 +200,41 @@ class Row(BaseRow, collections_abc.Sequence):
     def __getitem__(self, key):
         return self._data[key]
 
+    # Row is registered as a collections_abc.Sequence rather than
+    # subclassing it, so the sequence methods are implemented here
+    # against the data tuple.
+
+    def __reversed__(self):
+        return reversed(self._data)
+
+    def index(self, value, start=0, stop=None):
+        if stop is None:
+            return self._data.index(value, start)
+        else:
+            return self._data.index(value, start, stop)
+
+    def count(self, value):
+        return self._data.count(value)
+
     def __getstate__(self):
-        return {"_parent": self._parent, "_data": self._data}
+        return (self._parent, self._data)
 
     def __setstate__(self, state):
-        self._parent = parent = state["_parent"]
-        self._data = state["_data"]
-        self._keymap = parent._keymap
+        # rows pickled by previous versions store their state as a dict
+        if isinstance(state, dict):
+            parent, data = state["_parent"], state["_data"]
+        else:
+            parent, data = state
+        self._parent = parent
+        self._data = data
+        if _baserow_usecext:
+            self._keymap = parent._keymap
 
     def _op(self, other, op):
         return (
-            op(tuple(self), tuple(other))
+            op(self._data, other._data)
             if isinstance(other, Row)
-            else op(tuple(self), other)
+            else op(self._data, other)
         )
 
     __hash__ = BaseRow.__hash__
@@ -242,7 +280,7 @@ class Row(BaseRow, collections_abc.Sequence):
             :attr:`.Row._mapping`
 
         """
-        return [k for k in self._parent.keys if k is not None]
+        return list(self._parent._non_none_keys)
 
     @property
     def _fields(self):
@@ -259,15 +297,15 @@ class Row(BaseRow, collections_abc.Sequence):
             :attr:`.Row._mapping`
 
         """
-        return tuple([k for k in self._parent.keys if k is not None])
+        return self._parent._non_none_keys
 
     def _asdict(self):
         """Return a new dict which maps field names to their corresponding
         values.
 
         This method is analogous to the Python named tuple ``._asdict()``
-        method, and works by applying the ``dict()`` constructor to the
-        :attr:`.Row._mapping` attribute.
+        method, and returns the same dictionary as applying the ``dict()``
+        constructor to the :attr:`.Row._mapping` attribute.
 
         .. versionadded:: 1.4
 
@@ -276,7 +314,8 @@ class Row(BaseRow, collections_abc.Sequence):
             :attr:`.Row._mapping`
 
         """
-        return dict(self._mapping)
+        keys, getter = self._parent._keys_values_getter()
+        return dict(zip(keys, getter(self._data) if getter else self._data))
 
     def _replace(self):
         raise NotImplementedError()
@@ -304,8 +343,19 @@ class LegacyRow(Row):
     def __contains__(self, key):
         return self._parent._contains(key, self)
 
-    def __getitem__(self, key):
-        return self._get_by_key_impl(key)
+    if _baserow_usecext:
+
+        def __getitem__(self, key):
+            return self._get_by_key_impl(key)
+
+    else:
+
+        def __getitem__(self, key):
+            # integer keys index the data directly rather than going
+            # through the keymap; the C version handles them itself
+            if isinstance(key, util.int_types):
+                return self._data[key]
+            return self._get_by_key_impl(key)
 
     @util.deprecated(
         "1.4",
@@ -351,7 +401,7 @@ class LegacyRow(Row):
 
         """
 
-        return [(key, self[key]) for key in self.keys()]
+        return [(key, self[key]) for key in self._parent._non_none_keys]
 
     @util.deprecated(
         "1.4",
@@ -400,10 +450,41 @@ class LegacyRow(Row):
         return self._values_impl()
 
 
+# registering Row as a Sequence rather than subclassing it keeps ABCMeta
+# and the Sequence mixins out of the class hierarchy of every row
+collections_abc.Sequence.register(Row)
+
 BaseRowProxy = BaseRow
 RowProxy = Row
 
 
+def _column_property(index):
+    return property(lambda self: self._data[index])
+
+
+def _row_class_for_columns(row_cls, columns):
+    """Return a subclass of ``row_cls`` with a read-only property for
+    each ``(name, index)`` pair in ``columns``.
+
+    The properties allow ``row.name`` style access to resolve as a plain
+    descriptor rather than falling through to ``__getattr__`` and the
+    keymap.   The subclass pickles as ``row_cls`` itself, as it can't be
+    located by name when unpickled.
+
+    """
+
+    def __reduce__(self):
+        return (rowproxy_reconstructor, (row_cls, self.__getstate__()))
+
+    dict_ = {
+        "__module__": row_cls.__module__,
+        "__slots__": (),
+        "__reduce__": __reduce__,
+    }
+    dict_.update((name, _column_property(index)) for name, index in columns)
+    return type(row_cls.__name__, (row_cls,), dict_)
+
+
 class ROMappingView(
     collections_abc.KeysView,
     collections_abc.ValuesView,
@@ -430,11 +511,20 @@ class ROMappingView(
     def __contains__(self, item):
         return item in self._items
 
+    # _items is always a tuple; views are compared against each other
+    # without copying, other iterables are copied into a tuple once
+
     def __eq__(self, other):
-        return list(other) == list(self)
+        if isinstance(other, ROMappingView):
+            return self._items == other._items
+        else:
+            return tuple(other) == self._items
 
     def __ne__(self, other):
-        return list(other) != list(self)
+        if isinstance(other, ROMappingView):
+            return self._items != other._items
+        else:
+            return tuple(other) != self._items
 
 
 class RowMapping(collections_abc.Mapping):
@@ -459,42 +549,54 @@ class RowMapping(collections_abc.Mapping):
 
     """
 
-    __slots__ = ("row",)
+    __slots__ = ("row", "_get_by_key")
 
     def __init__(self, row):
         self.row = row
+        self._get_by_key = row._get_by_key_impl_mapping
 
     def __getitem__(self, key):
-        return self.row._get_by_key_impl_mapping(key)
+        return self._get_by_key(key)
 
     def __iter__(self):
-        return (k for k in self.row._parent.keys if k is not None)
+        return iter(self.row._parent._non_none_keys)
 
     def __len__(self):
         return len(self.row)
 
     def __contains__(self, key):
-        return self.row._parent._has_key(key)
+        # keys present in the keymap are always contained; only keys
+        # that aren't need to go through the parent's fallback rules
+        parent = self.row._parent
+        return key in parent._keymap or parent._has_key(key)
 
     def items(self):
         """Return a view of key/value tuples for the elements in the
         underlying :class:`.Row`.
 
         """
-        return ROMappingView(self, [(key, self[key]) for key in self.keys()])
+        row = self.row
+        data = row._data
+        return ROMappingView(
+            self,
+            tuple(
+                [
+                    (key, data[index])
+                    for key, index in row._parent._key_to_mdindex_pairs()
+                ]
+            ),
+        )
 
     def keys(self):
         """Return a view of 'keys' for string column names represented
         by the underlying :class:`.Row`.
 
         """
-        return ROMappingView(
-            self, [k for k in self.row._parent.keys if k is not None]
-        )
+        return ROMappingView(self, self.row._parent._non_none_keys)
 
     def values(self):
         """Return a view of values for the values represented in the
         underlying :class:`.Row`.
 
         """
-        return ROMappingView(self, self.row._values_impl())
+        return ROMappingView(self, self.row._data)
@@ -169,6 +169,7 @@ class RowTest(fixtures.TestBase):
             for key in keyobjs:
                 keymap[key] = (index, key)
             keymap[index] = (index, key)
+        metadata._index_map = {key: rec[0] for key, rec in keymap.items()}
         return row_cls(metadata, processors, keymap, row)
 
     def _test_getitem_value_refcounts_legacy(self, seq_factory):
@@ -121,6 +121,13 @@ class _KeyedTupleTest(object):
         eq_(keyed_tuple[1], 2)
         eq_(keyed_tuple[2], 3)
 
+    def test_none_label_single_key(self):
+        keyed_tuple = self._fixture([1, 2], [None, "b"])
+
+        eq_(keyed_tuple._fields, ("b",))
+        eq_(keyed_tuple._asdict(), {"b": 2})
+        eq_(keyed_tuple._mapping.items(), [("b", 2)])
+
     def test_duplicate_labels(self):
         keyed_tuple = self._fixture([1, 2, 3], ["a", "b", "b"])
         eq_(str(keyed_tuple), "(1, 2, 3)")
@@ -3,11 +3,14 @@ import logging.handlers
 import sqlalchemy as tsa
 from sqlalchemy import bindparam
 from sqlalchemy import Column
+from sqlalchemy import Integer
 from sqlalchemy import MetaData
 from sqlalchemy import or_
 from sqlalchemy import select
 from sqlalchemy import String
 from sqlalchemy import Table
+from sqlalchemy import text
+from sqlalchemy import TypeDecorator
 from sqlalchemy import util
 from sqlalchemy.sql import util as sql_util
 from sqlalchemy.testing import assert_raises_message
@@ -358,6 +361,35 @@ class LogParamsTest(fixtures.TestBase):
                 % (largeparam[0:148], largeparam[-149:]),
             )
 
+    def test_result_rows_logged_unprocessed(self):
+        class MyType(TypeDecorator):
+            impl = Integer
+
+            def process_result_value(self, value, dialect):
+                return value + 10
+
+        stmt = text("SELECT 1 AS x UNION ALL SELECT 2").columns(x=MyType())
+
+        self.eng.echo = "debug"
+        for columnar in (True, False):
+            del self.buf.buffer[:]
+            with self.eng.connect() as conn:
+                rows = (
+                    conn.execution_options(_columnar_results=columnar)
+                    .execute(stmt)
+                    .fetchall()
+                )
+
+            eq_(rows, [(11,), (12,)])
+            eq_(
+                [
+                    rec.message
+                    for rec in self.buf.buffer
+                    if rec.message.startswith("Row")
+                ],
+                ["Row (1,)", "Row (2,)"],
+            )
+
     def test_error_large_dict(self):
         assert_raises_message(
             tsa.exc.DBAPIError,
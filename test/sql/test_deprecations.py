@@ -1290,6 +1290,7 @@ class ResultProxyTest(fixtures.TablesTest):
             eq_(r[users.c.user_id], 2)
 
         r._keymap.pop(users.c.user_id)  # reset lookup
+        r._parent._index_map.pop(users.c.user_id, None)
         with testing.expect_deprecated(
             "Retreiving row values using Column objects "
             "with only matching names"
@@ -1318,6 +1319,7 @@ class ResultProxyTest(fixtures.TablesTest):
             eq_(r[users.c.user_id], 2)
 
         r._keymap.pop(users.c.user_id)
+        r._parent._index_map.pop(users.c.user_id, None)
         with testing.expect_deprecated(
             "Retreiving row values using Column objects "
             "with only matching names"
@@ -1333,6 +1335,7 @@ class ResultProxyTest(fixtures.TablesTest):
             eq_(r[users.c.user_name], "jack")
 
         r._keymap.pop(users.c.user_name)
+        r._parent._index_map.pop(users.c.user_name, None)
         with testing.expect_deprecated(
             "Retreiving row values using Column objects "
             "with only matching names"
@@ -1418,6 +1421,7 @@ class ResultProxyTest(fixtures.TablesTest):
                         eq_(result[0]._mapping[users.c.user_id], 7)
 
                     result[0]._keymap.pop(users.c.user_id)
+                    result[0]._parent._index_map.pop(users.c.user_id, None)
                     with testing.expect_deprecated(
                         "Retreiving row values using Column objects "
                         "from a row that was unpickled"
@@ -1431,6 +1435,7 @@ class ResultProxyTest(fixtures.TablesTest):
                         eq_(result[0]._mapping[users.c.user_name], "jack")
 
                     result[0]._keymap.pop(users.c.user_name)
+                    result[0]._parent._index_map.pop(users.c.user_name, None)
                     with testing.expect_deprecated(
                         "Retreiving row values using Column objects "
                         "from a row that was unpickled"
@@ -1457,6 +1462,7 @@ class ResultProxyTest(fixtures.TablesTest):
                         eq_(result[0]._mapping[addresses.c.user_id], 7)
 
                     result[0]._keymap.pop(addresses.c.user_id)
+                    result[0]._parent._index_map.pop(addresses.c.user_id, None)
                     with testing.expect_deprecated(
                         "Retreiving row values using Column objects "
                         "from a row that was unpickled"
@@ -1546,6 +1552,29 @@ class ResultProxyTest(fixtures.TablesTest):
         eq_(row._mapping["Case_insensitive"], 1)
         eq_(row._mapping["casesensitive"], 2)
 
+    def test_row_case_insensitive_index_map(self):
+        with testing.expect_deprecated(
+            "The create_engine.case_sensitive parameter is deprecated"
+        ):
+            ins_db = engines.testing_engine(options={"case_sensitive": False})
+        row = ins_db.execute(
+            select(
+                [
+                    literal_column("1").label("case_insensitive"),
+                    literal_column("2").label("CaseSensitive"),
+                ]
+            )
+        ).first()
+
+        parent = row._parent
+        eq_(parent._index_for_key("Case_insensitive"), 0)
+
+        # the index map is filled from the keymap, and keys located by
+        # the case insensitive fallback are added to it as well
+        eq_(parent._index_map["CaseSensitive"], 1)
+        eq_(parent._index_map["Case_insensitive"], 0)
+        eq_(row._mapping["Case_insensitive"], 1)
+
     def test_row_case_insensitive_unoptimized(self):
         with testing.expect_deprecated(
             "The create_engine.case_sensitive parameter is deprecated"
@@ -41,6 +41,7 @@ from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import in_
 from sqlalchemy.testing import is_
 from sqlalchemy.testing import is_false
+from sqlalchemy.testing import is_not_
 from sqlalchemy.testing import is_true
 from sqlalchemy.testing import le_
 from sqlalchemy.testing import ne_
@@ -744,6 +745,12 @@ class ResultProxyTest(fixtures.TablesTest):
             lambda: r._mapping["user_id"],
         )
 
+        assert_raises_message(
+            exc.InvalidRequestError,
+            "Ambiguous column name",
+            lambda: r._mapping.items(),
+        )
+
         assert_raises_message(
             exc.InvalidRequestError,
             "Ambiguous column name",
@@ -1164,6 +1171,83 @@ class ResultProxyTest(fixtures.TablesTest):
         eq_(r._mapping["_parent"], "Hidden parent")
         eq_(r._mapping["_row"], "Hidden row")
 
+    def test_column_accessor_row_class(self):
+        users = self.tables.users
+
+        users.insert().execute(user_id=7, user_name="jack")
+
+        stmt = text("select user_id, user_name from users")
+
+        with testing.db.connect() as conn:
+            # the first execution creates the metadata and uses the
+            # plain row class
+            conn = conn.execution_options(compiled_cache={})
+            r1 = conn.execute(stmt).first()
+            is_(type(r1), _result.LegacyRow)
+
+            # executions that reuse the cached metadata create rows as a
+            # subclass specific to the column names
+            r2 = conn.execute(stmt).first()
+            r3 = conn.execute(stmt).first()
+
+            # which is shared with other metadata that has the same names
+            conn = conn.execution_options(compiled_cache={})
+            conn.execute(stmt).first()
+            r4 = conn.execute(stmt).first()
+
+        row_cls = type(r2)
+        is_true(issubclass(row_cls, _result.LegacyRow))
+        is_not_(row_cls, _result.LegacyRow)
+        is_(type(r3), row_cls)
+        is_not_(r2._parent, r4._parent)
+        is_(type(r4), row_cls)
+        in_("user_name", row_cls.__dict__)
+        not_in_("keys", row_cls.__dict__)
+
+        eq_(r1.user_name, "jack")
+        eq_(r2.user_id, 7)
+        eq_(r2.user_name, "jack")
+        eq_(r4.user_name, "jack")
+
+        r5 = util.pickle.loads(util.pickle.dumps(r2))
+        is_(type(r5), _result.LegacyRow)
+        eq_(r5.user_name, "jack")
+
+    def test_column_accessor_dunder_label(self):
+        stmt = text(
+            'select 1 as "__classcell__", 2 as "__bool__", '
+            '3 as "_private", 4 as b'
+        )
+        with testing.db.connect() as conn:
+            conn = conn.execution_options(compiled_cache={})
+            conn.execute(stmt).first()
+            r = conn.execute(stmt).first()
+
+        # only plain names are added to the row class
+        row_cls = type(r)
+        in_("b", row_cls.__dict__)
+        not_in_("__classcell__", row_cls.__dict__)
+        not_in_("_private", row_cls.__dict__)
+        not_in_("__bool__", row_cls.__dict__)
+
+        is_true(bool(r))
+        eq_(r.b, 4)
+        eq_(r._private, 3)
+        eq_(r._mapping["__classcell__"], 1)
+        eq_(r._mapping["__bool__"], 2)
+
+    def test_column_accessor_trailing_newline(self):
+        stmt = text('select 1 as "a\n", 2 as b')
+        with testing.db.connect() as conn:
+            conn = conn.execution_options(compiled_cache={})
+            conn.execute(stmt).first()
+            r = conn.execute(stmt).first()
+
+        row_cls = type(r)
+        in_("b", row_cls.__dict__)
+        not_in_("a\n", row_cls.__dict__)
+        eq_(r._mapping["a\n"], 1)
+
     def test_nontuple_row(self):
         """ensure the C version of BaseRow handles
         duck-type-dependent rows.
@@ -1183,12 +1267,8 @@ class ResultProxyTest(fixtures.TablesTest):
             def __getitem__(self, i):
                 return list.__getitem__(self.internal_list, i)
 
-        proxy = Row(
-            object(),
-            [None],
-            {"key": (0, None, "key"), 0: (0, None, "key")},
-            MyList(["value"]),
-        )
+        parent = _result.SimpleResultMetaData(["key"])
+        proxy = Row(parent, [None], parent._keymap, MyList(["value"]))
         eq_(list(proxy), ["value"])
         eq_(proxy[0], "value")
         eq_(proxy._mapping["key"], "value")
@@ -1240,6 +1320,61 @@ class ResultProxyTest(fixtures.TablesTest):
         )
         is_true(isinstance(row, collections_abc.Sequence))
 
+    def test_row_sequence_methods(self):
+        row = _result.result_tuple(["a", "b", "c", "d"])((1, 2, 1, 3))
+
+        eq_(list(reversed(row)), [3, 1, 2, 1])
+        eq_(row.count(1), 2)
+        eq_(row.count(5), 0)
+        eq_(row.index(1), 0)
+        eq_(row.index(1, 1), 2)
+        eq_(row.index(1, -2), 2)
+        eq_(row.index(2, 0, None), 1)
+        assert_raises(ValueError, row.index, 3, 0, 3)
+
+    def test_row_keymap_is_parent_keymap(self):
+        row = _result.result_tuple(["a", "b"])((1, 2))
+        is_(row._keymap, row._parent._keymap)
+
+        r2 = util.pickle.loads(util.pickle.dumps(row))
+        is_(r2._keymap, r2._parent._keymap)
+
+    def test_row_unpickle_dict_state(self):
+        row = _result.result_tuple(["a", "b"])((1, 2))
+
+        # the state of rows pickled under previous versions is a dict
+        for state in (
+            row.__getstate__(),
+            {"_parent": row._parent, "_data": row._data},
+        ):
+            r2 = _result.rowproxy_reconstructor(_result.Row, state)
+            eq_(r2, (1, 2))
+            eq_(r2._mapping["b"], 2)
+            is_(r2._parent, row._parent)
+
+    def test_row_mapping_view_comparison(self):
+        row = _result.result_tuple(["a", "b"])((1, 2))
+        other = _result.result_tuple(["a", "b"])((1, 3))
+
+        eq_(row._mapping.items(), [("a", 1), ("b", 2)])
+        eq_(row._mapping.values(), (1, 2))
+        eq_(row._mapping.keys(), row._mapping.keys())
+        eq_(row._mapping.items(), row._mapping.items())
+        ne_(row._mapping.values(), other._mapping.values())
+        ne_(row._mapping.items(), [("a", 1)])
+        is_true(row._mapping.keys() == other._mapping.keys())
+        is_false(row._mapping.items() != row._mapping.items())
+
+    def test_row_no_processors(self):
+        """a processors collection of None indicates that no values
+        require processing."""
+
+        parent = _result.SimpleResultMetaData(["key", "value"])
+        row = Row(parent, None, parent._keymap, ["value", 5])
+        eq_(tuple(row), ("value", 5))
+        eq_(row._mapping["key"], "value")
+        eq_(row[1], 5)
+
     def test_row_is_hashable(self):
 
         row = Row(
@@ -1281,6 +1416,12 @@ class ResultProxyTest(fixtures.TablesTest):
         eq_(row[-1], "Uno")
         eq_(row[1:0:-1], ("Uno",))
 
+    @testing.only_on("sqlite")
+    def test_row_getitem_index_out_of_range(self):
+        row = testing.db.execute("select 'One' as key, 'Uno' as value").first()
+        assert_raises(IndexError, lambda: row[2])
+        assert_raises(IndexError, lambda: row[-3])
+
     @testing.requires.cextensions
     def test_row_c_sequence_check(self):
 
@@ -2078,6 +2219,63 @@ class AlternateResultProxyTest(fixtures.TablesTest):
                     r = conn.execute(stmt)
                     eq_(r.scalar(), "HI THERE")
 
+    @testing.combinations(
+        _result.DefaultCursorFetchStrategy,
+        _result.BufferedRowCursorFetchStrategy,
+        _result.FullyBufferedCursorFetchStrategy,
+        argnames="cls",
+    )
+    def test_columnar_results(self, cls):
+        class MyType(TypeDecorator):
+            impl = String()
+
+            def process_result_value(self, value, dialect):
+                return "HI " + value
+
+        test = self.tables.test
+        stmt = select([test.c.x, type_coerce(test.c.y, MyType())]).order_by(
+            test.c.x
+        )
+
+        with self._proxy_fixture(cls), patch.object(
+            _result, "_process_columns", wraps=_result._process_columns
+        ) as process_columns:
+            with self.engine.connect() as conn:
+                r = conn.execution_options(_columnar_results=True).execute(
+                    stmt
+                )
+                eq_(r.fetchone(), (1, "HI t_1"))
+
+                rows = r.fetchmany(3)
+                eq_(rows, [(i, "HI t_%d" % i) for i in range(2, 5)])
+                eq_(rows[0]._mapping["y"], "HI t_2")
+
+                rows = r.fetchall()
+                eq_(rows, [(i, "HI t_%d" % i) for i in range(5, 12)])
+                is_true(
+                    all(isinstance(row, _result.LegacyRow) for row in rows)
+                )
+                eq_(r.fetchall(), [])
+
+            # single row fetches are processed row by row
+            batch_sizes = [len(c[1][1]) for c in process_columns.mock_calls]
+            eq_(batch_sizes, [3, 7])
+
+    def test_columnar_results_default(self):
+        test = self.tables.test
+
+        with self.engine.connect() as conn:
+            # on by default only for the pure Python BaseRow
+            r = conn.execute(test.select())
+            eq_(r._columnar, not _result._baserow_usecext)
+            r.close()
+
+            r = conn.execution_options(_columnar_results=False).execute(
+                test.select()
+            )
+            is_false(r._columnar)
+            r.close()
+
     @testing.fixture
     def row_growth_fixture(self):
         with self._proxy_fixture(_result.BufferedRowCursorFetchStrategy):